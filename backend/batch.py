@@ -0,0 +1,265 @@
+"""离线批量生成督导工作汇总（无需启动 HTTP 服务，适合 cron 定时运行）。
+
+配置文件示例（JSON）：
+
+    {
+      "jobs": [
+        {"name": "一楼", "inputs": ["data/一楼/"], "output": "out/一楼汇总.docx"},
+        {"name": "二楼", "inputs": ["data/二楼/*.docx"], "output": "out/二楼汇总.docx"}
+      ]
+    }
+
+用法：
+
+    python -m backend.batch jobs.json --workers 4 --report out/report.json
+"""
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+from typing import List
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+try:
+    from .doc_processor import parse_documents, export_document, resolve_template_path
+except ImportError:
+    from doc_processor import parse_documents, export_document, resolve_template_path
+
+DEFAULT_STATE_FILE = '.batch_state.json'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def _expand_inputs(patterns: List[str], base_dir: Path) -> List[str]:
+    """展开目录与通配符为 .docx 文件列表（保持配置顺序，去重）。"""
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        target = base_dir / pattern
+        if target.is_dir():
+            matches = sorted(str(p) for p in target.glob('*.docx'))
+        else:
+            matches = sorted(glob.glob(str(target), recursive=True))
+        for path in matches:
+            name = os.path.basename(path)
+            # 跳过 Word 打开文档时生成的 ~$ 临时文件
+            if not name.lower().endswith('.docx') or name.startswith('~$'):
+                continue
+            resolved = os.path.abspath(path)
+            if resolved not in seen:
+                seen.add(resolved)
+                paths.append(resolved)
+    return paths
+
+def _hash_file(digest, path: str) -> None:
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+
+def _content_hash(paths: List[str], template_path: str) -> str:
+    """按输入顺序计算内容哈希；模板变化时同样需要重新生成。"""
+    digest = hashlib.sha256()
+    for path in [template_path] + paths:
+        digest.update(b'\0')
+        if path:
+            _hash_file(digest, path)
+    return digest.hexdigest()
+
+def _run_job(job: dict) -> dict:
+    """在子进程中执行单个部门的解析与导出，返回耗时等结果。"""
+    started = time.perf_counter()
+    result = {'name': job['name'], 'output': job['output'], 'inputs': len(job['paths']), 'hash': job['hash']}
+    try:
+        result_data = parse_documents(job['paths'])
+        parsed = time.perf_counter()
+        result['rows'] = len(result_data['rows'])
+        result['parse_seconds'] = round(parsed - started, 3)
+
+        # 任务之间已并行，单个导出不再开子进程
+        output_path = export_document(result_data, workers=1)
+        result['export_seconds'] = round(time.perf_counter() - parsed, 3)
+        if not output_path:
+            result['status'] = 'empty'
+        else:
+            os.makedirs(os.path.dirname(job['output']) or '.', exist_ok=True)
+            shutil.move(output_path, job['output'])
+            result['status'] = 'ok'
+    except Exception as exc:
+        result['status'] = 'error'
+        result['error'] = f'{type(exc).__name__}: {exc}'
+    result['total_seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+def _collect_job(future, job: dict) -> dict:
+    """取回子进程结果；工作进程异常退出（如被 OOM 终止）时记为该任务失败。"""
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        error = '工作进程异常退出'
+    except Exception as exc:
+        error = f'{type(exc).__name__}: {exc}'
+    return {'name': job['name'], 'output': job['output'], 'inputs': len(job['paths']),
+            'hash': job['hash'], 'status': 'error', 'error': error}
+
+def _load_state(path: Path) -> dict:
+    """读取内容哈希记录；不存在或已损坏时视为空（全部任务重新生成）。"""
+    if not path.exists():
+        return {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+def _load_config(path: Path) -> list:
+    """读取并校验配置文件，返回任务列表；配置本身无效时抛出 ValueError。"""
+    if not path.is_file():
+        raise ValueError(f'配置文件不存在: {path}')
+    try:
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f'配置文件不是有效的 JSON: {exc}') from exc
+    jobs = config.get('jobs') if isinstance(config, dict) else None
+    if not isinstance(jobs, list) or not jobs:
+        raise ValueError('配置文件中缺少非空的 jobs 列表')
+    return jobs
+
+def _parse_job(item, index: int, base_dir: Path) -> dict:
+    """解析单个任务配置；字段无效时在返回值中记录 error。"""
+    if not isinstance(item, dict):
+        return {'name': f'job{index}', 'output': None, 'inputs': [], 'error': '任务配置必须是对象'}
+    name = str(item.get('name') or f'job{index}')
+    output = item.get('output')
+    inputs = item.get('inputs')
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    if not isinstance(output, str) or not output.strip():
+        return {'name': name, 'output': None, 'inputs': [], 'error': '缺少 output'}
+    output = str((base_dir / output).resolve())
+    if not isinstance(inputs, list) or not all(isinstance(i, str) for i in inputs):
+        return {'name': name, 'output': output, 'inputs': [], 'error': 'inputs 必须是字符串或字符串列表'}
+    return {'name': name, 'output': output, 'inputs': inputs, 'error': None}
+
+def _write_json(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def run_batch(config_path: str, workers: int = None, report_path: str = None,
+              state_path: str = None, force: bool = False) -> dict:
+    """执行配置中的全部任务，返回运行报告；配置无效时抛出 ValueError。"""
+    config_file = Path(config_path).resolve()
+    base_dir = config_file.parent
+    jobs = [_parse_job(item, index, base_dir) for index, item in enumerate(_load_config(config_file), start=1)]
+    # 多个任务写同一输出文件会相互覆盖，哈希记录也会来回切换
+    seen_outputs = {}
+    for job in jobs:
+        if job['output'] is None:
+            continue
+        if job['output'] in seen_outputs:
+            raise ValueError(f"任务 {seen_outputs[job['output']]} 与 {job['name']} 的输出路径重复: {job['output']}")
+        seen_outputs[job['output']] = job['name']
+    state_file = Path(state_path).resolve() if state_path else base_dir / DEFAULT_STATE_FILE
+    state = _load_state(state_file)
+
+    template_path = resolve_template_path()
+    started_at = datetime.now().isoformat(timespec='seconds')
+    started = time.perf_counter()
+
+    results = []
+    pending = []
+    pending_slots = []
+    for job in jobs:
+        name, output = job['name'], job['output']
+        if job['error']:
+            results.append({'name': name, 'output': output, 'inputs': 0, 'status': 'error', 'error': job['error']})
+            continue
+        paths = _expand_inputs(job['inputs'], base_dir)
+        result = {'name': name, 'output': output, 'inputs': len(paths)}
+        if not paths:
+            result.update(status='error', error='未找到输入文件')
+            results.append(result)
+            continue
+        content_hash = _content_hash(paths, template_path)
+        # 输入与模板均未变化且输出仍存在时跳过
+        if not force and state.get(output) == content_hash and os.path.exists(output):
+            result.update(status='skipped', hash=content_hash)
+            results.append(result)
+            continue
+        pending.append({'name': name, 'output': output, 'paths': paths, 'hash': content_hash})
+        # 先占位，保证报告中的任务顺序与配置一致
+        pending_slots.append(len(results))
+        results.append(None)
+
+    if pending:
+        max_workers = min(workers or os.cpu_count() or 1, len(pending))
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_run_job, job) for job in pending]
+                job_results = [_collect_job(future, job) for future, job in zip(futures, pending)]
+        else:
+            job_results = [_run_job(job) for job in pending]
+        for slot, result in zip(pending_slots, job_results):
+            results[slot] = result
+
+    for result in results:
+        if result['status'] == 'ok':
+            state[result['output']] = result['hash']
+        elif result['status'] in ('empty', 'error') and result['output']:
+            state.pop(result['output'], None)
+    _write_json(state_file, state)
+
+    report = {
+        'started_at': started_at,
+        'total_seconds': round(time.perf_counter() - started, 3),
+        'succeeded': sum(1 for r in results if r['status'] == 'ok'),
+        'skipped': sum(1 for r in results if r['status'] == 'skipped'),
+        'failed': sum(1 for r in results if r['status'] in ('empty', 'error')),
+        'jobs': results,
+    }
+    if report_path:
+        _write_json(Path(report_path).resolve(), report)
+    return report
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'必须是正整数: {value}')
+    return number
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='离线批量生成督导工作汇总文档')
+    parser.add_argument('config', help='任务配置文件（JSON）')
+    parser.add_argument('--workers', type=_positive_int, default=None, help='并行进程数（默认 CPU 核数）')
+    parser.add_argument('--report', default=None, help='运行报告输出路径（JSON），默认输出到标准输出')
+    parser.add_argument('--state', default=None, help=f'内容哈希记录文件（默认配置文件同目录下 {DEFAULT_STATE_FILE}）')
+    parser.add_argument('--force', action='store_true', help='忽略内容哈希，强制重新生成全部任务')
+    args = parser.parse_args(argv)
+
+    try:
+        report = run_batch(args.config, workers=args.workers, report_path=args.report,
+                           state_path=args.state, force=args.force)
+    except ValueError as exc:
+        sys.stderr.write(f'错误: {exc}\n')
+        return 2
+    if not args.report:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+    return 1 if report['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,23 +2,34 @@ from docx import Document
 from docx.shared import Pt, Cm, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_ROW_HEIGHT_RULE
-from docx.oxml import OxmlElement
+from docx.oxml import OxmlElement, parse_xml
 from docx.oxml.ns import qn
-try:
-    import pandas as pd
-except Exception:
-    pd = None
+from docx.table import Table, _Cell, _Row
+from lxml import etree
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import tempfile
 import re
 import os
+import sys
 from datetime import datetime
 
 # 表头字段
 COLUMNS = ['序号', '值班助理', '日期', '上书量（本）', '纠错量（本）',
            '整架范围/整架号', '工作地点', '值班签到', '督导检查情况', '督导检查情况2']
-ROW_TEXT_FIELDS = ['值班助理', '日期', '整架范围', '工作地点', '值班签到', '督导检查情况']
-ROW_NUMBER_FIELDS = ['上书量', '纠错量']
-ROW_FIELDS = ROW_TEXT_FIELDS + ROW_NUMBER_FIELDS
+# API 行字段与 DutyRow 属性的对应关系，顺序即 JSON 字段顺序
+ROW_FIELDS = [('值班助理', 'assistant'), ('日期', 'date'), ('整架范围', 'shelf_range'),
+              ('工作地点', 'location'), ('值班签到', 'sign_in'), ('督导检查情况', 'supervision'),
+              ('上书量', 'books'), ('纠错量', 'corrections')]
+ROW_NUMBER_FIELDS = {'上书量', '纠错量'}
+# 数据行数达到该值且 EXPORT_WORKERS > 1 时，按助理分组多进程渲染
+PARALLEL_EXPORT_MIN_ROWS = 500
+# 每个进程分到的批次数：批次按分组连续切分，表头 XML 每批只传一次
+EXPORT_BATCHES_PER_WORKER = 4
+
+# 导出进程池在多次请求间复用，避免每次导出都重新启动子进程
+_export_pool = None
+_export_pool_workers = 0
 
 def _set_seq_field(cell, seq_name: str = 'DutySeq') -> None:
     """在单元格中插入 Word SEQ 字段，用于自动编号。"""
@@ -59,54 +70,101 @@ def _parse_int(value: str) -> int:
     m = re.search(r'\d+', value)
     return int(m.group()) if m else 0
 
+def _text_value(value) -> str:
+    return str(value).strip() if value is not None else ''
+
+def _number_value(value) -> int:
+    try:
+        return int(str(value).strip() or 0)
+    except Exception:
+        return 0
+
+class DutyRow:
+    """单条值班记录的紧凑内部表示。
+
+    解析→去重→排序→导出全程使用该类型，助理姓名与工作地点做字符串驻留，
+    日期排序键在构造时计算一次；仅在 API 边界通过 to_dict 转为原有 JSON 结构。
+    """
+
+    __slots__ = ('assistant', 'date', 'shelf_range', 'location', 'sign_in',
+                 'supervision', 'books', 'corrections', 'date_sort')
+
+    def __init__(self, assistant: str, date: str, shelf_range: str, location: str,
+                 sign_in: str, supervision: str, books: int, corrections: int):
+        self.assistant = sys.intern(assistant)
+        self.date = date
+        self.shelf_range = shelf_range
+        self.location = sys.intern(location)
+        self.sign_in = sign_in
+        self.supervision = supervision
+        self.books = books
+        self.corrections = corrections
+        self.date_sort = _parse_date_for_sort(date)
+
+    @classmethod
+    def from_dict(cls, row: dict) -> 'DutyRow':
+        """从 API 传入的 dict（中文字段名）构造，并规范化字段类型。"""
+        values = {}
+        for field, attr in ROW_FIELDS:
+            convert = _number_value if field in ROW_NUMBER_FIELDS else _text_value
+            values[attr] = convert(row.get(field, ''))
+        return cls(**values)
+
+    def to_dict(self) -> dict:
+        """转换为 API 使用的 dict，字段顺序与 ROW_FIELDS 一致。"""
+        return {field: getattr(self, attr) for field, attr in ROW_FIELDS}
+
 def _normalize_rows(rows: list) -> list:
-    """规范化行数据字段与类型，确保导出/计算稳定。"""
+    """规范化行数据为 DutyRow，确保导出/计算稳定（已是 DutyRow 的直接复用）。"""
     normalized = []
     for row in rows:
-        if not isinstance(row, dict):
-            continue
-        normalized_row = {}
-        for field in ROW_FIELDS:
-            value = row.get(field, '')
-            if field in ROW_NUMBER_FIELDS:
-                try:
-                    normalized_row[field] = int(str(value).strip() or 0)
-                except Exception:
-                    normalized_row[field] = 0
-            else:
-                normalized_row[field] = str(value).strip() if value is not None else ''
-        normalized.append(normalized_row)
+        if isinstance(row, DutyRow):
+            normalized.append(row)
+        elif isinstance(row, dict):
+            normalized.append(DutyRow.from_dict(row))
     return normalized
 
 def _compute_totals(rows: list) -> dict:
     """从行数据计算汇总字段。"""
-    names = [r.get('值班助理', '').strip() for r in rows if r.get('值班助理')]
     return {
-        '总人数': len(set(names)),
+        '总人数': len({r.assistant for r in rows if r.assistant}),
         '总班次': len(rows),
-        '上书量合计': sum(r.get('上书量', 0) or 0 for r in rows),
-        '纠错量合计': sum(r.get('纠错量', 0) or 0 for r in rows),
+        '上书量合计': sum(r.books for r in rows),
+        '纠错量合计': sum(r.corrections for r in rows),
     }
 
 def _sort_rows_for_export(rows: list) -> list:
     """按组最早日期+姓名+日期排序，保证同名连续以便合并单元格。"""
     rows = _normalize_rows(rows)
-    items = []
-    for idx, row in enumerate(rows):
-        name = row.get('值班助理', '').strip()
-        date_sort = _parse_date_for_sort(row.get('日期', ''))
-        items.append((idx, name, date_sort, row))
-
     min_date_map = {}
-    for _, name, date_sort, _ in items:
-        if not name:
+    for row in rows:
+        if not row.assistant:
             continue
-        prev = min_date_map.get(name)
-        if prev is None or date_sort < prev:
-            min_date_map[name] = date_sort
+        prev = min_date_map.get(row.assistant)
+        if prev is None or row.date_sort < prev:
+            min_date_map[row.assistant] = row.date_sort
 
-    items.sort(key=lambda item: (min_date_map.get(item[1], datetime.max), item[1], item[2], item[0]))
-    return [row for _, _, _, row in items]
+    # sorted 是稳定排序，等价于以原始下标作为最后一级排序键
+    return sorted(rows, key=lambda row: (min_date_map.get(row.assistant, datetime.max), row.assistant, row.date_sort))
+
+def _merge_problems(rows: list) -> str:
+    """按日期聚合已排序行中的“存在问题”，去除重复项。"""
+    problem_items = []
+    for idx, row in enumerate(rows):
+        problem = extract_problems(row.supervision)
+        if problem:
+            problem_items.append((row.date_sort, idx, problem.strip()))
+    if not problem_items:
+        return ''
+    problem_items.sort(key=lambda item: (item[0], item[1]))
+    seen = set()
+    dedup_list = []
+    for _, __, p in problem_items:
+        key = re.sub(r'\s+', '', p)
+        if key and key not in seen:
+            seen.add(key)
+            dedup_list.append(p)
+    return '\n'.join(dedup_list)
 
 def _sort_problem_lines(text: str) -> list:
     """按日期前缀排序问题行（如 11.05xxx / 11月05日xxx）。"""
@@ -159,17 +217,16 @@ def parse_single_document(file_path: str) -> list:
         if not c1:  # 助理姓名为空则跳过
             continue
 
-        rows_data.append({
-            '序号': c0,
-            '值班助理': c1,
-            '日期': c2,
-            '上书量': _parse_int(_cell_text(cells, 3)),
-            '纠错量': _parse_int(_cell_text(cells, 4)),
-            '整架范围': _cell_text(cells, 5),
-            '工作地点': _cell_text(cells, 6),
-            '值班签到': _cell_text(cells, 7),
-            '督导检查情况': _cell_text(cells, 8),
-        })
+        rows_data.append(DutyRow(
+            c1,
+            c2,
+            _cell_text(cells, 5),
+            _cell_text(cells, 6),
+            _cell_text(cells, 7),
+            _cell_text(cells, 8),
+            _parse_int(_cell_text(cells, 3)),
+            _parse_int(_cell_text(cells, 4)),
+        ))
 
     return rows_data
 
@@ -210,116 +267,33 @@ def _parse_date_for_sort(value: str) -> datetime:
     return datetime.max
 
 def parse_documents(file_paths: list) -> dict:
-    """解析多个文档并整合数据"""
-    all_rows = []
-    all_problems = []
-
-    for path in file_paths:
-        rows = parse_single_document(path)
-        all_rows.extend(rows)
-
-        # 提取问题
-        for row in rows:
-            problem = extract_problems(row.get('督导检查情况', ''))
-            if problem:
-                all_problems.append(problem.strip())
-
-    if not all_rows:
-        return {'rows': [], 'totals': {}, 'problems': ''}
+    """解析多个文档并整合数据
 
+    返回的 rows 为 DutyRow 列表，经 HTTP 返回前需逐行 to_dict。
+    """
     # 去重：值班助理 + 日期 + 整架范围 + 工作地点 完全一致时视为重复
     # 注意：这里保留第一条出现的记录
     seen_records = set()
     unique_rows = []
-    for row in all_rows:
-        # 构造唯一键
-        key = (
-            row.get('值班助理', '').strip(),
-            row.get('日期', '').strip(),
-            row.get('整架范围', '').strip(),
-            row.get('工作地点', '').strip()
-        )
-        if key not in seen_records:
-            seen_records.add(key)
-            unique_rows.append(row)
-
-    if pd is None:
-        rows_out = _sort_rows_for_export(unique_rows)
-        totals = _compute_totals(rows_out)
-
-        merged_problems = ''
-        if rows_out:
-            problem_items = []
-            for idx, row in enumerate(rows_out):
-                problem = extract_problems(row.get('督导检查情况', ''))
-                if problem:
-                    problem_items.append((_parse_date_for_sort(row.get('日期', '')), idx, problem.strip()))
-            if problem_items:
-                problem_items.sort(key=lambda item: (item[0], item[1]))
-                seen = set()
-                dedup_list = []
-                for _, __, p in problem_items:
-                    key = re.sub(r'\\s+', '', p)
-                    if key and key not in seen:
-                        seen.add(key)
-                        dedup_list.append(p)
-                merged_problems = '\\n'.join(dedup_list)
-
-        return {
-            'rows': rows_out,
-            'totals': totals,
-            'problems': merged_problems
-        }
-    
-    # 转为DataFrame进行排序与字段清洗
-    df = pd.DataFrame(unique_rows)
-    for col in ROW_TEXT_FIELDS:
-        if col not in df:
-            df[col] = ''
-        df[col] = df[col].fillna('').astype(str)
-    for col in ROW_NUMBER_FIELDS:
-        if col not in df:
-            df[col] = 0
-        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
-
-    # 构造排序辅助列：按每个人最早日期分组排序，组内再按日期排序
-    try:
-        df['__date_sort__'] = df['日期'].apply(_parse_date_for_sort)
-    except Exception:
-        df['__date_sort__'] = datetime.max
-    df['__min_date__'] = df.groupby('值班助理')['__date_sort__'].transform('min')
-    df = df.sort_values(['__min_date__', '值班助理', '__date_sort__'], ascending=[True, True, True], kind='mergesort')
-    df = df.drop(columns=['__date_sort__', '__min_date__'])
-
-    rows_out = _sort_rows_for_export(df.to_dict('records'))
-    totals = _compute_totals(rows_out)
-
-    # 督导检查情况按排序后的行进行聚合，确保日期顺序稳定
-    merged_problems = ''
-    if rows_out:
-        problem_items = []
-        for idx, row in enumerate(rows_out):
-            problem = extract_problems(row.get('督导检查情况', ''))
-            if problem:
-                problem_items.append((_parse_date_for_sort(row.get('日期', '')), idx, problem.strip()))
-        if problem_items:
-            problem_items.sort(key=lambda item: (item[0], item[1]))
-            seen = set()
-            dedup_list = []
-            for _, __, p in problem_items:
-                key = re.sub(r'\s+', '', p)
-                if key and key not in seen:
-                    seen.add(key)
-                    dedup_list.append(p)
-            merged_problems = '\n'.join(dedup_list)
+    for path in file_paths:
+        for row in parse_single_document(path):
+            key = (row.assistant, row.date, row.shelf_range, row.location)
+            if key not in seen_records:
+                seen_records.add(key)
+                unique_rows.append(row)
+
+    if not unique_rows:
+        return {'rows': [], 'totals': {}, 'problems': ''}
 
+    # 按每个人最早日期分组排序，组内再按日期排序；督导检查情况按排序后的行聚合，确保日期顺序稳定
+    rows_out = _sort_rows_for_export(unique_rows)
     return {
         'rows': rows_out,
-        'totals': totals,
-        'problems': merged_problems
+        'totals': _compute_totals(rows_out),
+        'problems': _merge_problems(rows_out)
     }
 
-def _resolve_template_path() -> str:
+def resolve_template_path() -> str:
     """优先使用后端目录中的模板，避免部署时找不到根目录模板。"""
     env_path = os.getenv('TEMPLATE_PATH')
     candidates = []
@@ -337,10 +311,110 @@ def _resolve_template_path() -> str:
             return path
     return ''
 
-def export_document(data: dict) -> str:
-    """导出汇总文档"""
+def _export_workers() -> int:
+    """读取 EXPORT_WORKERS 环境变量，默认单进程导出。"""
+    try:
+        return max(1, int(os.getenv('EXPORT_WORKERS', '1')))
+    except ValueError:
+        return 1
+
+def _get_export_pool(workers: int) -> ProcessPoolExecutor:
+    global _export_pool, _export_pool_workers
+    if _export_pool is None or _export_pool_workers != workers:
+        if _export_pool is not None:
+            _export_pool.shutdown(wait=False)
+        _export_pool = ProcessPoolExecutor(max_workers=workers)
+        _export_pool_workers = workers
+    return _export_pool
+
+def _discard_export_pool() -> None:
+    global _export_pool, _export_pool_workers
+    if _export_pool is not None:
+        _export_pool.shutdown(wait=False)
+    _export_pool = None
+    _export_pool_workers = 0
+
+def _split_groups(rows: list) -> list:
+    """将已排序的行按相邻的同名助理切分为分组。"""
+    groups = []
+    last_name = None
+    for row in rows:
+        name = row.assistant
+        if not groups or name != last_name:
+            groups.append([])
+            last_name = name
+        groups[-1].append(row)
+    return groups
+
+def _format_cell(cell, alignment) -> None:
+    """统一单元格段落对齐与字体（宋体 12pt）。"""
+    for paragraph in cell.paragraphs:
+        paragraph.alignment = alignment
+        for run in paragraph.runs:
+            run.font.name = '宋体'
+            run.font.size = Pt(12)
+            run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
+            run._element.rPr.rFonts.set(qn('w:ascii'), '宋体')
+            run._element.rPr.rFonts.set(qn('w:hAnsi'), '宋体')
+            run._element.rPr.rFonts.set(qn('w:cs'), '宋体')
+
+def _render_group_fragment(job: tuple) -> list:
+    """渲染一个助理分组的数据行，返回各行 w:tr 的 XML。
+
+    job 为 (仅含表头的表格 XML, 分组行数据, 分组序号)，可在子进程中执行。
+    """
+    tbl_xml, group_rows, group_index = job
+    table = Table(parse_xml(tbl_xml), None)
+
+    # 直接按 w:tc 构造单元格，避免 row.cells 每次扫描整张表
+    data_rows = []
+    row_cells = []
+    for row in group_rows:
+        table_row = table.add_row()
+        cells = [_Cell(tc, table) for tc in table_row._tr.tc_lst]
+        cells[2].text = row.date
+        cells[3].text = str(row.books)
+        cells[4].text = str(row.corrections)
+        cells[5].text = row.shelf_range
+        cells[6].text = row.location
+        cells[7].text = row.sign_in or '√'
+        # 督导检查情况两列先在行内横向合并，跨行合并由调用方在拼接后完成
+        cells[8].merge(cells[9])
+        data_rows.append(table_row)
+        row_cells.append(cells[:8])
+
+    # 合并序号和姓名列，并填写内容（一个人一个序号）
+    first_cells = row_cells[0]
+    if len(data_rows) > 1:
+        last_cells = row_cells[-1]
+        for col in [0, 1]:
+            first_cells[col].merge(last_cells[col])
+    first_cells[0].text = str(group_index)
+    first_cells[1].text = group_rows[0].assistant
+
+    # 数据行最小高度 1.71cm，允许督导检查情况扩展
+    for table_row, cells in zip(data_rows, row_cells):
+        table_row.height_rule = WD_ROW_HEIGHT_RULE.AT_LEAST
+        table_row.height = Cm(1.71)
+        # 序号/姓名合并后以首行单元格为准
+        for cell in first_cells[:2] + cells[2:]:
+            cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
+            _format_cell(cell, WD_ALIGN_PARAGRAPH.CENTER)
+
+    return [etree.tostring(table_row._tr) for table_row in data_rows]
+
+def _render_group_batch(job: tuple) -> list:
+    """渲染一批连续分组，job 为 (表头表格 XML, [(分组行数据, 分组序号), ...])。"""
+    tbl_xml, batch = job
+    return [_render_group_fragment((tbl_xml, group_rows, group_index)) for group_rows, group_index in batch]
+
+def export_document(data: dict, workers: int = None) -> str:
+    """导出汇总文档
+
+    workers > 1 且数据量较大时按助理分组多进程渲染表格行；默认读取 EXPORT_WORKERS。
+    """
     # 使用模板文档
-    template_path = _resolve_template_path()
+    template_path = resolve_template_path()
     if not template_path:
         raise FileNotFoundError('未找到模板文件：图书管理岗督导工作情况通报(模板).docx')
     doc = Document(template_path)
@@ -364,54 +438,40 @@ def export_document(data: dict) -> str:
         tr = table._tbl.tr_lst[-1]
         table._tbl.remove(tr)
 
-    # 数据行 - 先添加所有行，记录分组信息
-    groups = []  # [(start_index, end_index, name), ...]
-    group_start_index = None
-    last_name = None
-
-    for i, row in enumerate(rows, start=1):
-        table.add_row()
-        name = row.get('值班助理', '')
-
-        if name != last_name:
-            if group_start_index is not None:
-                groups.append((group_start_index, i - 1, last_name))
-            group_start_index = i
-            last_name = name
-
-        table.rows[i].cells[2].text = row.get('日期', '')
-        table.rows[i].cells[3].text = str(row.get('上书量', 0))
-        table.rows[i].cells[4].text = str(row.get('纠错量', 0))
-        table.rows[i].cells[5].text = row.get('整架范围', '')
-        table.rows[i].cells[6].text = row.get('工作地点', '')
-        table.rows[i].cells[7].text = row.get('值班签到') or '√'
-
-    # 记录最后一组
-    if group_start_index is not None:
-        groups.append((group_start_index, len(rows), last_name))
-
-    # 合并督导检查情况列（先合并，再填内容）
-    if len(rows) > 0:
-        if len(rows) > 1:
-            table.rows[1].cells[8].merge(table.rows[len(rows)].cells[8])
-            table.rows[1].cells[9].merge(table.rows[len(rows)].cells[9])
-        table.rows[1].cells[8].merge(table.rows[1].cells[9])
-
-    # 合并序号和姓名列，并填写内容
-    group_index = 1
-    for (start_idx, end_idx, name) in groups:
-        # 合并多行
-        if end_idx > start_idx:
-            for col in [0, 1]:
-                table.rows[start_idx].cells[col].merge(table.rows[end_idx].cells[col])
-        # 填写序号与姓名（一个人一个序号）
-        table.rows[start_idx].cells[0].text = str(group_index)
-        table.rows[start_idx].cells[1].text = name
-        group_index += 1
+    # 数据行 - 按助理分组渲染行片段（大表可多进程并行），再按顺序拼回模板表格
+    groups = [(group_rows, group_index) for group_index, group_rows in enumerate(_split_groups(rows), start=1)]
+    tbl_xml = etree.tostring(table._tbl)
+    if workers is None:
+        workers = _export_workers()
+    fragments = None
+    if workers > 1 and len(groups) > 1 and len(rows) >= PARALLEL_EXPORT_MIN_ROWS:
+        batch_count = min(len(groups), workers * EXPORT_BATCHES_PER_WORKER)
+        batch_size = -(-len(groups) // batch_count)
+        jobs = [(tbl_xml, groups[i:i + batch_size]) for i in range(0, len(groups), batch_size)]
+        try:
+            batches = _get_export_pool(workers).map(_render_group_batch, jobs)
+            fragments = [fragment for batch in batches for fragment in batch]
+        except BrokenProcessPool:
+            # 子进程异常退出时丢弃进程池，本次改为单进程渲染
+            _discard_export_pool()
+    if fragments is None:
+        fragments = _render_group_batch((tbl_xml, groups))
+    data_trs = []
+    for fragment in fragments:
+        for tr_xml in fragment:
+            tr = parse_xml(tr_xml)
+            table._tbl.append(tr)
+            data_trs.append(tr)
+
+    # 合并督导检查情况列：片段中已横向合并 8/9 列，这里补上跨行的纵向合并
+    if len(data_trs) > 1:
+        data_trs[0].tc_lst[8].vMerge = 'restart'
+        for tr in data_trs[1:]:
+            tr.tc_lst[8].vMerge = 'continue'
 
     # 填写督导检查情况（合并后再填写）
     if len(rows) > 0:
-        cell = table.rows[1].cells[8]
+        cell = _Cell(data_trs[0].tc_lst[8], table)
         cell.text = ''
         cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.TOP
 
@@ -442,96 +502,69 @@ def export_document(data: dict) -> str:
 
     # 总计行
     total_row = table.add_row()
+    total_cells = [_Cell(tc, table) for tc in total_row._tr.tc_lst]
     # 0. 总计
-    total_row.cells[0].text = ''
-    p_total = total_row.cells[0].paragraphs[0]
+    total_cells[0].text = ''
+    p_total = total_cells[0].paragraphs[0]
     r_total = p_total.add_run('总\n计')
     r_total.bold = True
     
     # 1. 人数 (值班助理列)
-    total_row.cells[1].text = f"{totals.get('总人数', 0)}人"
+    total_cells[1].text = f"{totals.get('总人数', 0)}人"
     # 2. 班次 (日期列)
-    total_row.cells[2].text = f"{totals.get('总班次', 0)}班"
+    total_cells[2].text = f"{totals.get('总班次', 0)}班"
     # 3. 上书量 (上书量列)
-    total_row.cells[3].text = str(totals.get('上书量合计', 0))
+    total_cells[3].text = str(totals.get('上书量合计', 0))
     # 4. 纠错量 (纠错量列)
-    total_row.cells[4].text = str(totals.get('纠错量合计', 0))
+    total_cells[4].text = str(totals.get('纠错量合计', 0))
     # 5. 整架范围 (占位)
-    total_row.cells[5].text = '-'
+    total_cells[5].text = '-'
     # 6. 工作地点 (占位)
-    total_row.cells[6].text = '-'
+    total_cells[6].text = '-'
     # 7. 值班签到 (占位)
-    total_row.cells[7].text = '-'
+    total_cells[7].text = '-'
     # 8. 督导检查 (占位)
-    total_row.cells[8].text = '-'
+    total_cells[8].text = '-'
     # 9. 督导检查2 (占位)
-    total_row.cells[9].text = '-'
+    total_cells[9].text = '-'
     
     # 合并最后两列
-    total_row.cells[8].merge(total_row.cells[9])
+    total_cells[8].merge(total_cells[9])
 
     # 备注行
     note_row = table.add_row()
-    note_row.cells[0].text = ''
-    p_note_title = note_row.cells[0].paragraphs[0]
+    note_cells = [_Cell(tc, table) for tc in note_row._tr.tc_lst]
+    note_cells[0].text = ''
+    p_note_title = note_cells[0].paragraphs[0]
     r_note_title = p_note_title.add_run('备注')
     r_note_title.bold = True
     
     note_text = '每位助理工作情况良好，能很好地兼顾学习和工作，整体的工作状态都不错，但其中仍存在部分不足，希望大家有则改之，无则加勉。'
-    note_row.cells[1].text = ''
-    p_note_content = note_row.cells[1].paragraphs[0]
+    note_cells[1].text = ''
+    p_note_content = note_cells[1].paragraphs[0]
     r_note_content = p_note_content.add_run(note_text)
     r_note_content.bold = True
     
-    # 合并备注内容单元格
-    table.rows[len(rows) + 2].cells[1].merge(table.rows[len(rows) + 2].cells[7])
-    note_row.cells[8].text = '值班督导'
-
-    # 设置全局字体、行高与对齐方式
-    data_row_start = 1
-    data_row_end = len(rows)
-    note_row_idx = len(rows) + 2
-    for row_idx, row in enumerate(table.rows):
-        is_data_row = data_row_start <= row_idx <= data_row_end
-        # 数据行最小高度 1.71cm，允许督导检查情况扩展
-        if is_data_row:
-            row.height_rule = WD_ROW_HEIGHT_RULE.AT_LEAST
-            row.height = Cm(1.71)
-        else:
-            row.height = Cm(1.71)
-            row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
-
-        for col_idx, cell in enumerate(row.cells):
-            is_left_block = col_idx <= 7
-            is_supervisor_cell = is_data_row and col_idx >= 8
-            is_note_content_cell = row_idx == note_row_idx and col_idx == 1
-
-            if is_note_content_cell:
-                cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
-            elif is_left_block:
-                cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
-            elif is_supervisor_cell:
-                cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.TOP
-            else:
-                cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
-
-            for paragraph in cell.paragraphs:
-                if is_note_content_cell:
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                elif is_left_block:
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                elif is_supervisor_cell:
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                else:
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-                for run in paragraph.runs:
-                    run.font.name = '宋体'
-                    run.font.size = Pt(12)
-                    run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-                    run._element.rPr.rFonts.set(qn('w:ascii'), '宋体')
-                    run._element.rPr.rFonts.set(qn('w:hAnsi'), '宋体')
-                    run._element.rPr.rFonts.set(qn('w:cs'), '宋体')
+    # 合并备注内容单元格（合并后原第 8 列的 w:tc 不变，仍可直接使用）
+    note_cells[1].merge(note_cells[7])
+    note_cells[8].text = '值班督导'
+
+    # 设置表头、总计、备注行的字体、行高与对齐方式（数据行已在片段中处理）
+    # 直接遍历 w:tc，避免 row.cells 扫描整张表；合并单元格只处理一次。
+    # 备注内容单元格横跨第 1-7 列，原先按列格式化时会被后续列覆盖为居中，这里保持居中不变。
+    for tr in (table._tbl.tr_lst[0], total_row._tr, note_row._tr):
+        table_row = _Row(tr, table)
+        table_row.height = Cm(1.71)
+        table_row.height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
+        for tc in tr.tc_lst:
+            cell = _Cell(tc, table)
+            cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
+            _format_cell(cell, WD_ALIGN_PARAGRAPH.CENTER)
+
+    # 督导检查情况合并单元格：顶端左对齐
+    supervisor_cell = _Cell(data_trs[0].tc_lst[8], table)
+    supervisor_cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.TOP
+    _format_cell(supervisor_cell, WD_ALIGN_PARAGRAPH.LEFT)
 
     # 保存到临时文件
     # 打开文档时自动更新字段（SEQ 编号等）
@@ -1,7 +1,6 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, RedirectResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse, RedirectResponse, Response
 from pathlib import Path
 from typing import List
 import tempfile
@@ -9,8 +8,10 @@ import os
 import uuid
 try:
     from .doc_processor import parse_documents, export_document
+    from .static_files import StaticIndex, StaticAsset
 except ImportError:
     from doc_processor import parse_documents, export_document
+    from static_files import StaticIndex, StaticAsset
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 FRONTEND_DIST = ROOT_DIR / "frontend" / "dist"
@@ -29,16 +30,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-if FRONTEND_DIST.exists():
-    assets_dir = FRONTEND_DIST / "assets"
-    if assets_dir.exists():
-        app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
-
-@app.get("/", include_in_schema=False)
-async def root():
-    index_path = FRONTEND_DIST / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+# 启动时索引前端构建产物，请求时直接从内存返回（含预压缩变体）
+static_index = StaticIndex(FRONTEND_DIST)
+
+def _static_response(asset: StaticAsset, request: Request) -> Response:
+    body, encoding = StaticIndex.select(asset, request.headers.get("accept-encoding", ""))
+    etag = asset.etag if encoding is None else f'{asset.etag[:-1]}-{encoding}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": asset.cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    if request.method == "HEAD":
+        headers["Content-Length"] = str(len(body))
+        return Response(media_type=asset.media_type, headers=headers)
+    return Response(content=body, media_type=asset.media_type, headers=headers)
+
+@app.api_route("/", methods=["GET", "HEAD"], include_in_schema=False)
+async def root(request: Request):
+    if static_index.index is not None:
+        return _static_response(static_index.index, request)
     frontend_url = os.getenv("FRONTEND_URL", "").strip() or "https://minfu666.github.io/deal_word"
     if frontend_url:
         return RedirectResponse(url=frontend_url)
@@ -103,6 +121,7 @@ async def upload_files(files: List[UploadFile] = File(...)):
         except Exception as exc:
             raise HTTPException(status_code=500, detail=f"解析失败: {exc}") from exc
 
+    result["rows"] = [row.to_dict() for row in result["rows"]]
     return result
 
 @app.post("/export")
@@ -119,15 +138,16 @@ async def export_file(data: dict, background_tasks: BackgroundTasks):
         background=background_tasks,
     )
 
-@app.get("/{full_path:path}", include_in_schema=False)
-async def spa_fallback(full_path: str):
-    if FRONTEND_DIST.exists():
-        file_path = FRONTEND_DIST / full_path
-        if file_path.is_file():
-            return FileResponse(file_path)
-        index_path = FRONTEND_DIST / "index.html"
-        if index_path.exists():
-            return FileResponse(index_path)
+@app.api_route("/{full_path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def spa_fallback(full_path: str, request: Request):
+    asset = static_index.lookup(full_path)
+    if asset is not None:
+        return _static_response(asset, request)
+    # 带哈希的资源不存在时返回 404，避免把 index.html 当作 JS/CSS 缓存
+    if full_path.startswith("assets/"):
+        raise HTTPException(status_code=404, detail="Not Found")
+    if static_index.index is not None:
+        return _static_response(static_index.index, request)
     raise HTTPException(status_code=404, detail="Not Found")
 
 if __name__ == "__main__":
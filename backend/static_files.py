@@ -0,0 +1,116 @@
+"""前端构建产物的内存索引：启动时读取 frontend/dist 并预先生成 br/gzip 压缩变体。"""
+from pathlib import Path
+from typing import Dict, Optional
+import gzip
+import hashlib
+import mimetypes
+import re
+import brotli
+
+# Vite 构建产物中带内容哈希的文件名（[name]-[hash].[ext]，哈希 8 位），如 index-DNdVMZLX.js
+HASHED_NAME_RE = re.compile(r'-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+MIN_COMPRESS_BYTES = 512
+# 预压缩后缀：优先级从高到低
+ENCODING_SUFFIXES = (('br', '.br'), ('gzip', '.gz'))
+
+class StaticAsset:
+    """单个静态文件的内存索引项（原文件与压缩变体）。"""
+
+    __slots__ = ('body', 'media_type', 'etag', 'cache_control', 'variants')
+
+    def __init__(self, body: bytes, media_type: str, cache_control: str):
+        self.body = body
+        self.media_type = media_type
+        self.etag = f'"{hashlib.md5(body).hexdigest()}"'
+        self.cache_control = cache_control
+        self.variants: Dict[str, bytes] = {}
+
+def _guess_media_type(path: Path) -> str:
+    if path.suffix == '.js':
+        return 'application/javascript'
+    media_type, _ = mimetypes.guess_type(path.name)
+    return media_type or 'application/octet-stream'
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.startswith(COMPRESSIBLE_TYPES)
+
+def _accepted_encodings(header: str) -> tuple:
+    """解析 Accept-Encoding，返回 (接受的编码, 明确拒绝的编码 q=0)。"""
+    accepted = set()
+    refused = set()
+    for item in (header or '').split(','):
+        parts = [p.strip() for p in item.split(';')]
+        name = parts[0].lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in parts[1:]:
+            if param.startswith('q='):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            accepted.add(name)
+        else:
+            refused.add(name)
+    return accepted, refused
+
+class StaticIndex:
+    """启动时一次性索引前端构建目录，按请求从内存返回文件。"""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.assets: Dict[str, StaticAsset] = {}
+        self.index: Optional[StaticAsset] = None
+        if root.is_dir():
+            self._build()
+
+    def _build(self) -> None:
+        for path in sorted(self.root.rglob('*')):
+            if not path.is_file() or path.suffix in ('.br', '.gz'):
+                continue
+            rel = path.relative_to(self.root).as_posix()
+            media_type = _guess_media_type(path)
+            cache_control = IMMUTABLE_CACHE_CONTROL if (
+                rel.startswith('assets/') and HASHED_NAME_RE.search(path.name)
+            ) else REVALIDATE_CACHE_CONTROL
+            asset = StaticAsset(path.read_bytes(), media_type, cache_control)
+            if _is_compressible(media_type) and len(asset.body) >= MIN_COMPRESS_BYTES:
+                self._load_variants(path, asset)
+            self.assets[rel] = asset
+        self.index = self.assets.get('index.html')
+
+    def _load_variants(self, path: Path, asset: StaticAsset) -> None:
+        """优先使用构建时生成的 .br/.gz，缺失时在启动阶段压缩。"""
+        for encoding, suffix in ENCODING_SUFFIXES:
+            prebuilt = path.with_name(path.name + suffix)
+            if prebuilt.is_file():
+                asset.variants[encoding] = prebuilt.read_bytes()
+        if 'br' not in asset.variants:
+            asset.variants['br'] = brotli.compress(asset.body)
+        if 'gzip' not in asset.variants:
+            asset.variants['gzip'] = gzip.compress(asset.body, compresslevel=9, mtime=0)
+        # 压缩后反而更大的变体没有意义
+        for encoding in list(asset.variants):
+            if len(asset.variants[encoding]) >= len(asset.body):
+                del asset.variants[encoding]
+
+    def lookup(self, rel_path: str) -> Optional[StaticAsset]:
+        return self.assets.get(rel_path.lstrip('/'))
+
+    @staticmethod
+    def select(asset: StaticAsset, accept_encoding: str):
+        """返回 (body, content_encoding)；客户端不支持压缩时返回原文件。"""
+        if asset.variants:
+            accepted, refused = _accepted_encodings(accept_encoding)
+            for encoding, _ in ENCODING_SUFFIXES:
+                if encoding not in asset.variants or encoding in refused:
+                    continue
+                # * 只匹配未被明确拒绝的编码
+                if encoding in accepted or '*' in accepted:
+                    return asset.variants[encoding], encoding
+        return asset.body, None